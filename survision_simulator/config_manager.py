@@ -2,7 +2,27 @@ import json
 import os
 import logging
 import logging.config
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Mapping, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def _loads(data: bytes) -> Any:
+    """Decode JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode an object as indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
 
 
 class ConfigManager:
@@ -30,6 +50,8 @@ class ConfigManager:
         self.config_file_path = config_file_path
         self.logger = logging.getLogger("simulator.config")
         self.config = self._load_config()
+        self._config_snapshot: Optional[Mapping[str, Any]] = None
+        self._listeners: List[Callable[[], None]] = []
     
     def _load_config(self) -> Dict[str, Any]:
         """
@@ -38,41 +60,67 @@ class ConfigManager:
         Returns:
             Dict containing configuration values
         """
-        if os.path.exists(self.config_file_path):
-            try:
-                with open(self.config_file_path, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                self.logger.error(f"Error loading config file: {e}")
-                return self.DEFAULT_CONFIG.copy()
-        else:
+        try:
+            with open(self.config_file_path, 'rb') as f:
+                return _loads(f.read())
+        except FileNotFoundError:
             # Create default config file
             self.save_config(self.DEFAULT_CONFIG)
             return self.DEFAULT_CONFIG.copy()
+        except (json.JSONDecodeError, IOError) as e:
+            self.logger.error(f"Error loading config file: {e}")
+            return self.DEFAULT_CONFIG.copy()
     
     def save_config(self, config: Optional[Dict[str, Any]] = None) -> None:
         """
         Save the current configuration to file.
         
+        The file is written to a temporary path and then moved into place,
+        so a failed write never leaves a truncated config behind.
+        
         Args:
             config: Configuration to save, defaults to current config
         """
         config_to_save = self.config if config is None else config
         
+        tmp_path = self.config_file_path + ".tmp"
         try:
-            with open(self.config_file_path, 'w') as f:
-                json.dump(config_to_save, f, indent=2)
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(config_to_save))
+            os.replace(tmp_path, self.config_file_path)
         except IOError as e:
             self.logger.error(f"Error saving config file: {e}")
     
-    def get_config(self) -> Dict[str, Any]:
+    def _config_changed(self) -> None:
+        """Invalidate cached state and persist the configuration."""
+        self._config_snapshot = None
+        for listener in self._listeners:
+            listener()
+        self.save_config()
+    
+    def get_config(self) -> Mapping[str, Any]:
         """
         Get the current configuration.
         
+        The returned mapping is a read-only snapshot that is reused until the
+        configuration changes. It is not a dict: use dict() on it to get a
+        copy that can be modified or passed to json.dumps.
+        
         Returns:
-            Dict containing configuration values
+            Read-only mapping containing configuration values
         """
-        return self.config.copy()
+        if self._config_snapshot is None:
+            self._config_snapshot = MappingProxyType(self.config.copy())
+        return self._config_snapshot
+    
+    def register_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Register a callback invoked after every configuration change.
+        
+        Args:
+            listener: Callable taking no arguments
+        """
+        self._listeners.append(listener)
     
     def update_config(self, updates: Dict[str, Any]) -> None:
         """
@@ -82,7 +130,7 @@ class ConfigManager:
             updates: Dict containing configuration updates
         """
         self.config.update(updates)
-        self.save_config()
+        self._config_changed()
     
     def get_value(self, key: str, default: Any = None) -> Any:
         """
@@ -106,4 +154,4 @@ class ConfigManager:
             value: New value
         """
         self.config[key] = value
-        self.save_config()
+        self._config_changed()
@@ -1,8 +1,15 @@
+import itertools
+import sys
 import threading
 import time
-from typing import Dict, List, Literal, Optional, Set, Protocol, Union
+from collections import deque
+from contextlib import contextmanager
+from typing import (
+    Deque, Dict, FrozenSet, Iterator, List, Literal, Mapping, Optional, Set, Tuple, Union
+)
 from dataclasses import dataclass
 from enum import Enum, auto
+from types import MappingProxyType
 
 from survision_simulator.models import (
     AnprEvent, RecognitionEvent,
@@ -18,31 +25,32 @@ class EventType(Enum):
     REBOOT = auto()
 
 
-class WebSocketClient(Protocol):
-    """Protocol for WebSocket clients to ensure type safety."""
-    def send(self, data: str) -> None: ...
+# Name of the StreamConfig flag that subscribes a client to each event type
+_EVENT_SUBSCRIPTION_ATTRS: Dict[EventType, str] = {
+    event_type: event_type.name.lower() for event_type in EventType
+}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BarrierEvent:
     action: Literal["open", "close"]
     timestamp: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DatabaseEvent:
     action: Literal["add", "remove", "clear"]
     plate: Optional[str]
     timestamp: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SecurityEvent:
     action: Literal["password_change", "rsa_change"]
     timestamp: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RebootEvent:
     timestamp: int
 
@@ -50,16 +58,109 @@ class RebootEvent:
 Event = Union[BarrierEvent, DatabaseEvent, RecognitionEvent, SecurityEvent, RebootEvent]
 
 
+class DeviceStateTransaction:
+    """
+    View of a DataStore's device state used inside DataStore.transaction.
+    
+    The caller already holds the device state lock, so these methods
+    access the state directly without locking again.
+    """
+    
+    def __init__(self, store: "DataStore"):
+        """
+        Initialize the view.
+        
+        Args:
+            store: Data store whose state lock is held
+        """
+        self._store = store
+    
+    def lock_device(self, password: Optional[str] = None) -> bool:
+        """
+        Lock the device with an optional password.
+        
+        Args:
+            password: Optional password to lock the device
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        store = self._store
+        # If a lock password is set, verify it
+        if store._lock_password is not None and password != store._lock_password:
+            return False
+        
+        store._is_locked = True
+        return True
+    
+    def unlock_device(self) -> bool:
+        """
+        Unlock the device.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        self._store._is_locked = False
+        return True
+    
+    def is_device_locked(self) -> bool:
+        """
+        Check if the device is locked.
+        
+        Returns:
+            True if locked, False otherwise
+        """
+        return self._store._is_locked
+    
+    def is_barrier_open(self) -> bool:
+        """
+        Check if the barrier is open.
+        
+        Returns:
+            True if open, False otherwise
+        """
+        return self._store._barrier_open
+    
+    def is_config_allowed(self) -> bool:
+        """
+        Check if configuration changes are allowed.
+        
+        Returns:
+            True if allowed, False otherwise
+        """
+        return self._store._allow_set_config
+    
+    def get_current_recognition(self) -> Optional[AnprEvent]:
+        """
+        Get the current recognition data.
+        
+        Returns:
+            Current recognition data or None
+        """
+        return self._store._current_recognition
+
+
 class DataStore:
     """
     In-memory data store for the Survision device simulator.
     Handles storage of device state, database plates, and logs.
-    Thread-safe access for read/write operations.
+    Thread-safe access for read/write operations: each kind of state is
+    guarded by its own lock, held by mutators. Getters that read a single
+    attribute return it directly, as reading one attribute is atomic.
     """
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the data store with default values."""
-        self._lock = threading.RLock()
+        # Each group of related state has its own lock so that, e.g., a
+        # database lookup does not contend with a barrier update. When
+        # several are needed they are taken in the order: state/db/ws,
+        # then log.
+        self._state_lock = threading.Lock()
+        # Only serializes writers: the plate database is published as an
+        # immutable snapshot, see _plates_database below.
+        self._db_lock = threading.Lock()
+        self._log_lock = threading.Lock()
+        self._ws_lock = threading.Lock()
         
         # Device state
         self._is_locked = False
@@ -67,25 +168,38 @@ class DataStore:
         self._allow_set_config = True
         
         # Security settings
-        self._lock_password = None
-        self._lock_password_hint = None
-        self._rsa_hint = None
+        self._lock_password: Optional[str] = None
+        self._lock_password_hint: Optional[str] = None
+        self._rsa_hint: Optional[str] = None
         
-        # Database of plates
-        self._plates_database: Set[str] = set()
+        # Database of plates. Writers build a new frozenset and swap the
+        # reference, so readers can use the current one without locking.
+        self._plates_database: FrozenSet[str] = frozenset()
         
         # Current recognition data
         self._current_recognition: Optional[AnprEvent] = None
         
         # Log of recent events (limited size)
-        self._event_log: List[Event] = []
         self._max_log_size = 100
+        self._event_log: Deque[Event] = deque(maxlen=self._max_log_size)
         
-        # WebSocket clients and their subscriptions
+        # WebSocket clients and their subscriptions. The dict is replaced
+        # rather than mutated, so views handed out stay consistent.
         self._ws_clients: Dict[str, StreamConfig] = {}
         
-        # Simulated date (milliseconds since epoch)
+        # Index of subscribed client IDs per event type, kept in sync with
+        # _ws_clients so broadcasts do not have to scan every client
+        self._subscribers_by_event: Dict[EventType, Set[str]] = {
+            event_type: set() for event_type in EventType
+        }
+        
+        # Stream configuration last requested through setEnableStreams
+        self._stream_config: Optional[StreamConfig] = None
+        
+        # Simulated date (milliseconds since epoch) and its string form.
+        # Plain attributes, so reads and writes are atomic and need no lock.
         self._simulated_date = int(time.time() * 1000)
+        self._simulated_date_str = str(self._simulated_date)
     
     def lock_device(self, password: Optional[str] = None) -> bool:
         """
@@ -97,13 +211,8 @@ class DataStore:
         Returns:
             True if successful, False otherwise
         """
-        with self._lock:
-            # If a lock password is set, verify it
-            if self._lock_password is not None and password != self._lock_password:
-                return False
-                
-            self._is_locked = True
-            return True
+        with self.transaction() as state:
+            return state.lock_device(password)
     
     def unlock_device(self, password: Optional[str] = None) -> bool:
         """
@@ -115,9 +224,22 @@ class DataStore:
         Returns:
             True if successful, False otherwise
         """
-        with self._lock:
-            self._is_locked = False
-            return True
+        with self.transaction() as state:
+            return state.unlock_device()
+    
+    @contextmanager
+    def transaction(self) -> Iterator[DeviceStateTransaction]:
+        """
+        Hold the device state lock across several operations.
+        
+        Lets a caller check and update device state atomically, paying
+        for a single lock acquisition instead of one per call.
+        
+        Yields:
+            View of the device state usable while the lock is held
+        """
+        with self._state_lock:
+            yield DeviceStateTransaction(self)
     
     def is_device_locked(self) -> bool:
         """
@@ -126,8 +248,7 @@ class DataStore:
         Returns:
             True if locked, False otherwise
         """
-        with self._lock:
-            return self._is_locked
+        return self._is_locked
     
     def has_lock_password(self) -> bool:
         """
@@ -136,8 +257,7 @@ class DataStore:
         Returns:
             True if a password is set, False otherwise
         """
-        with self._lock:
-            return self._lock_password is not None
+        return self._lock_password is not None
     
     def set_lock_password(self, password: str) -> None:
         """
@@ -146,11 +266,11 @@ class DataStore:
         Args:
             password: Password to set
         """
-        with self._lock:
+        with self._state_lock:
             self._lock_password = password
             self._add_event_log(SecurityEvent(
                 action="password_change",
-                timestamp=self.get_simulated_date()
+                timestamp=self._simulated_date
             ))
     
     def set_lock_password_hint(self, hint: str) -> None:
@@ -160,7 +280,7 @@ class DataStore:
         Args:
             hint: Password hint to set
         """
-        with self._lock:
+        with self._state_lock:
             self._lock_password_hint = hint
     
     def get_lock_password_hint(self) -> Optional[str]:
@@ -170,8 +290,7 @@ class DataStore:
         Returns:
             Password hint or None
         """
-        with self._lock:
-            return self._lock_password_hint
+        return self._lock_password_hint
     
     def set_rsa_hint(self, hint: str) -> None:
         """
@@ -180,11 +299,11 @@ class DataStore:
         Args:
             hint: RSA hint to set
         """
-        with self._lock:
+        with self._state_lock:
             self._rsa_hint = hint
             self._add_event_log(SecurityEvent(
                 action="rsa_change",
-                timestamp=self.get_simulated_date()
+                timestamp=self._simulated_date
             ))
     
     def get_rsa_hint(self) -> Optional[str]:
@@ -194,8 +313,7 @@ class DataStore:
         Returns:
             RSA hint or None
         """
-        with self._lock:
-            return self._rsa_hint
+        return self._rsa_hint
     
     def open_barrier(self) -> bool:
         """
@@ -204,11 +322,11 @@ class DataStore:
         Returns:
             True if successful, False otherwise
         """
-        with self._lock:
+        with self._state_lock:
             self._barrier_open = True
             self._add_event_log(BarrierEvent(
                 action="open",
-                timestamp=self.get_simulated_date()
+                timestamp=self._simulated_date
             ))
             return True
     
@@ -219,11 +337,11 @@ class DataStore:
         Returns:
             True if successful, False otherwise
         """
-        with self._lock:
+        with self._state_lock:
             self._barrier_open = False
             self._add_event_log(BarrierEvent(
                 action="close",
-                timestamp=self.get_simulated_date()
+                timestamp=self._simulated_date
             ))
             return True
     
@@ -234,8 +352,7 @@ class DataStore:
         Returns:
             True if open, False otherwise
         """
-        with self._lock:
-            return self._barrier_open
+        return self._barrier_open
     
     def set_allow_config(self, allow: bool) -> None:
         """
@@ -244,7 +361,7 @@ class DataStore:
         Args:
             allow: True to allow, False to forbid
         """
-        with self._lock:
+        with self._state_lock:
             self._allow_set_config = allow
     
     def is_config_allowed(self) -> bool:
@@ -254,8 +371,7 @@ class DataStore:
         Returns:
             True if allowed, False otherwise
         """
-        with self._lock:
-            return self._allow_set_config
+        return self._allow_set_config
     
     def add_plate_to_database(self, plate: str) -> bool:
         """
@@ -267,12 +383,15 @@ class DataStore:
         Returns:
             True if successful, False otherwise
         """
-        with self._lock:
-            self._plates_database.add(plate)
+        # Interned plates compare by identity when looked up with other
+        # interned strings, and repeated plates share a single object
+        plate = sys.intern(plate)
+        with self._db_lock:
+            self._plates_database = self._plates_database | {plate}
             self._add_event_log(DatabaseEvent(
                 action="add",
                 plate=plate,
-                timestamp=self.get_simulated_date()
+                timestamp=self._simulated_date
             ))
             return True
     
@@ -286,13 +405,13 @@ class DataStore:
         Returns:
             True if successful, False if plate not in database
         """
-        with self._lock:
+        with self._db_lock:
             if plate in self._plates_database:
-                self._plates_database.remove(plate)
+                self._plates_database = self._plates_database - {plate}
                 self._add_event_log(DatabaseEvent(
                     action="remove",
                     plate=plate,
-                    timestamp=self.get_simulated_date()
+                    timestamp=self._simulated_date
                 ))
                 return True
             return False
@@ -304,12 +423,12 @@ class DataStore:
         Returns:
             True if successful, False otherwise
         """
-        with self._lock:
-            self._plates_database.clear()
+        with self._db_lock:
+            self._plates_database = frozenset()
             self._add_event_log(DatabaseEvent(
                 action="clear",
                 plate=None,
-                timestamp=self.get_simulated_date()
+                timestamp=self._simulated_date
             ))
             return True
     
@@ -320,8 +439,31 @@ class DataStore:
         Returns:
             List of plates
         """
-        with self._lock:
-            return list(self._plates_database)
+        return list(self._plates_database)
+    
+    def get_database_snapshot(self) -> FrozenSet[str]:
+        """
+        Get the current plate database without copying it.
+        
+        The database is replaced, never mutated, on every change, so the
+        same object is returned until a plate is added or removed.
+        
+        Returns:
+            Immutable set of plates
+        """
+        return self._plates_database
+    
+    def is_plate_in_database(self, plate: str) -> bool:
+        """
+        Check if a plate is in the database.
+        
+        Args:
+            plate: License plate to look up
+            
+        Returns:
+            True if the plate is in the database, False otherwise
+        """
+        return plate in self._plates_database
     
     def set_current_recognition(self, recognition: AnprEvent) -> None:
         """
@@ -330,7 +472,7 @@ class DataStore:
         Args:
             recognition: Recognition data
         """
-        with self._lock:
+        with self._state_lock:
             self._current_recognition = recognition
             self._add_event_log(recognition.anpr)
     
@@ -341,8 +483,7 @@ class DataStore:
         Returns:
             Current recognition data or None
         """
-        with self._lock:
-            return self._current_recognition
+        return self._current_recognition
     
     def simulate_reboot(self) -> None:
         """
@@ -350,7 +491,7 @@ class DataStore:
         
         This resets certain device state but preserves configuration.
         """
-        with self._lock:
+        with self._state_lock:
             # Reset device state
             self._is_locked = False
             self._barrier_open = False
@@ -360,10 +501,10 @@ class DataStore:
             
             # Log the reboot event
             self._add_event_log(RebootEvent(
-                timestamp=self.get_simulated_date()
+                timestamp=self._simulated_date
             ))
     
-    def get_event_logs(self, limit: Optional[int] = None) -> List[Event]:
+    def get_event_logs(self, limit: Optional[int] = None) -> Tuple[Event, ...]:
         """
         Get recent event logs.
         
@@ -371,25 +512,26 @@ class DataStore:
             limit: Maximum number of logs to return
             
         Returns:
-            List of event logs
+            Tuple of event logs, oldest first
         """
-        with self._lock:
+        with self._log_lock:
             if limit is None:
-                return self._event_log.copy()
-            return self._event_log[-limit:].copy()
+                return tuple(self._event_log)
+            start = max(0, len(self._event_log) - limit)
+            return tuple(itertools.islice(self._event_log, start, None))
     
     def _add_event_log(self, event: Event) -> None:
         """
         Add an event to the log, maintaining maximum size.
         
+        The log is a bounded deque, so the oldest event is dropped
+        automatically once the maximum size is reached.
+        
         Args:
             event: Event data to log
         """
-        self._event_log.append(event)
-        
-        # Trim log if it exceeds maximum size
-        if len(self._event_log) > self._max_log_size:
-            self._event_log = self._event_log[-self._max_log_size:]
+        with self._log_lock:
+            self._event_log.append(event)
     
     def register_ws_client(self, client: str, subscriptions: Optional[StreamConfig] = None) -> None:
         """
@@ -399,7 +541,7 @@ class DataStore:
             client: WebSocket client ID
             subscriptions: Dict of subscription flags
         """
-        with self._lock:
+        with self._ws_lock:
             if subscriptions is None:
                 subscriptions = StreamConfig(
                     config_changes=False,
@@ -407,7 +549,8 @@ class DataStore:
                     traces=False,
                     cameras={}
                 )
-            self._ws_clients[client] = subscriptions
+            self._ws_clients = {**self._ws_clients, client: subscriptions}
+            self._index_ws_client(client, subscriptions)
     
     def unregister_ws_client(self, client: str) -> None:
         """
@@ -416,9 +559,12 @@ class DataStore:
         Args:
             client: WebSocket client ID
         """
-        with self._lock:
+        with self._ws_lock:
             if client in self._ws_clients:
-                del self._ws_clients[client]
+                clients = dict(self._ws_clients)
+                del clients[client]
+                self._ws_clients = clients
+                self._index_ws_client(client, None)
     
     def update_ws_client_subscriptions(self, client: str, subscriptions: StreamConfig) -> None:
         """
@@ -428,15 +574,31 @@ class DataStore:
             client: WebSocket client ID
             subscriptions: Dict of subscription flags
         """
-        with self._lock:
+        with self._ws_lock:
             if client in self._ws_clients:
-                self._ws_clients[client] = subscriptions
+                self._ws_clients = {**self._ws_clients, client: subscriptions}
+                self._index_ws_client(client, subscriptions)
+    
+    def _index_ws_client(self, client: str, subscriptions: Optional[StreamConfig]) -> None:
+        """
+        Update the per-event subscriber index for a client.
+        
+        Args:
+            client: WebSocket client ID
+            subscriptions: Client subscriptions, or None to remove the client
+        """
+        for event_type, subscribers in self._subscribers_by_event.items():
+            attr = _EVENT_SUBSCRIPTION_ATTRS[event_type]
+            if subscriptions is not None and getattr(subscriptions, attr, False):
+                subscribers.add(client)
+            else:
+                subscribers.discard(client)
     
     def set_stream_config(self, stream_config: StreamConfig) -> None:
         """
         Set the stream configuration.
         """
-        with self._lock:
+        with self._ws_lock:
             self._stream_config = stream_config
 
     def get_ws_clients_for_event(self, event_type: EventType) -> List[str]:
@@ -449,19 +611,17 @@ class DataStore:
         Returns:
             List of subscribed client IDs
         """
-        with self._lock:
-            return [client for client, subs in self._ws_clients.items() 
-                    if getattr(subs, event_type.name.lower(), False)]
+        with self._ws_lock:
+            return list(self._subscribers_by_event[event_type])
     
-    def get_all_ws_clients(self) -> Dict[str, StreamConfig]:
+    def get_all_ws_clients(self) -> Mapping[str, StreamConfig]:
         """
         Get all WebSocket clients and their subscriptions.
         
         Returns:
-            Dict of clients and subscriptions
+            Read-only snapshot of clients and subscriptions
         """
-        with self._lock:
-            return self._ws_clients.copy()
+        return MappingProxyType(self._ws_clients)
     
     def set_simulated_date(self, date_ms: int) -> None:
         """
@@ -470,8 +630,8 @@ class DataStore:
         Args:
             date_ms: Date in milliseconds since epoch
         """
-        with self._lock:
-            self._simulated_date = date_ms
+        self._simulated_date = date_ms
+        self._simulated_date_str = str(date_ms)
     
     def get_simulated_date(self) -> int:
         """
@@ -480,5 +640,13 @@ class DataStore:
         Returns:
             Date in milliseconds since epoch
         """
-        with self._lock:
-            return self._simulated_date
+        return self._simulated_date
+    
+    def get_simulated_date_str(self) -> str:
+        """
+        Get the simulated date as a string, as sent in answers.
+        
+        Returns:
+            Date in milliseconds since epoch, as a decimal string
+        """
+        return self._simulated_date_str
@@ -1,19 +1,26 @@
 import base64
+import itertools
 import random
 import time
-from typing import Dict, Any, Optional, Tuple, Callable, Union
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Deque, Dict, Any, FrozenSet, Iterator, Optional, Tuple, Callable, Union
 import logging
 from datetime import datetime
 
+import pydantic_core
 
 from survision_simulator.config_manager import ConfigManager
 from survision_simulator.data_store import DataStore
 from survision_simulator.models import (
+    AddPlateModel,
     AnprInfo,
     AnswerType,
     CameraInfo,
     CharacterReliability,
     DatabaseMatch,
+    DelPlateModel,
     DeviceInfo,
     DeviceInfoResponse,
     ErrorResponse,
@@ -26,7 +33,6 @@ from survision_simulator.models import (
     GetDateMessage,
     KeepAliveMessage,
     SetupMessage,
-    StreamConfig,
     GetCurrentLogMessage,
     SuccessResponse,
     TriggerAnswer,
@@ -74,8 +80,83 @@ from survision_simulator.models import (
 )
 
 # Type for message handler functions
-HandlerResult = Dict[str, Any]
-MessageHandler = Callable[[MessageType], HandlerResult]
+HandlerResult = Optional[AnswerType]
+MessageHandler = Callable[[Any, Any], HandlerResult]
+
+# Plates picked from when a recognition is simulated without an explicit plate
+_SAMPLE_PLATES = ("XX 000 XX", "XX 000 XY")
+
+# XSD schema returned by getXSD, encoded once at import time
+_XSD_CONTENT = '<?xml version="1.0" encoding="UTF-8"?><xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"></xs:schema>'
+_XSD_BASE64 = base64.b64encode(_XSD_CONTENT.encode()).decode()
+
+# Sample image data (base64 encoded)
+_SAMPLE_IMAGE = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg=="
+
+
+# Answer shared by every successful command
+_SUCCESS_ANSWER = SuccessResponse().as_answer()
+
+
+def _acknowledge(device_logic: "DeviceLogic", message: MessageType) -> StatusAnswer:
+    """
+    Handle a message that the simulator only acknowledges.
+
+    Args:
+        device_logic: Device logic the message was sent to
+        message: CDK message as a Pydantic model
+
+    Returns:
+        Success response
+    """
+    return _SUCCESS_ANSWER
+
+
+@lru_cache(maxsize=64)
+def _error_answer(error_text: str) -> StatusAnswer:
+    """
+    Build the error answer for a message, reusing recent ones.
+
+    Most error texts come from a small fixed set, so the answers are
+    shared instead of rebuilt on every failed request.
+
+    Args:
+        error_text: Error message
+
+    Returns:
+        Error response
+    """
+    return ErrorResponse.for_error_text(error_text).as_answer()
+
+
+@dataclass(slots=True, frozen=True)
+class TriggerSession:
+    """An active trigger opened by triggerOn."""
+
+    camera_id: str
+    timeout: int
+    # time.monotonic_ns() when the trigger was opened, immune to clock jumps
+    start_ns: int
+
+
+@lru_cache(maxsize=128)
+def _reliability_per_character(length: int, reliability: int) -> ReliabilityPerCharacter:
+    """
+    Build the per-character reliabilities of a plate, reusing earlier ones.
+
+    Every character gets the same reliability, so the result depends only
+    on the plate length and is shared between recognition events.
+
+    Args:
+        length: Number of characters in the plate
+        reliability: Reliability of each character
+
+    Returns:
+        Per-character reliability data
+    """
+    return ReliabilityPerCharacter(
+        char=[CharacterReliability(index=i, reliability=reliability) for i in range(length)]
+    )
 
 
 class DeviceLogic:
@@ -84,6 +165,26 @@ class DeviceLogic:
     Handles device operations, plate recognition, and message processing.
     """
 
+    __slots__ = (
+        "logger",
+        "config_manager",
+        "data_store",
+        "_plate_reliability",
+        "_default_context",
+        "_recognition_success_rate",
+        "_rng",
+        "_cached_config_answer",
+        "_cached_database_answer",
+        "_xsd_answer",
+        "_traces_answer",
+        "_infos_answers",
+        "_static_http_json",
+        "_static_ws_json",
+        "active_triggers",
+        "_triggers_by_camera",
+        "_trigger_ids",
+    )
+
     def __init__(self, config_manager: ConfigManager, data_store: DataStore):
         """
         Initialize the device logic with configuration and data store.
@@ -92,7 +193,6 @@ class DeviceLogic:
             config_manager: Configuration manager
             data_store: Data store
         """
-        logging.basicConfig(level=logging.DEBUG)
         self.logger = logging.getLogger(__name__)
 
         self.logger.info("DeviceLogic initialized with ConfigManager and DataStore")
@@ -100,11 +200,54 @@ class DeviceLogic:
         self.config_manager = config_manager
         self.data_store = data_store
 
-        # Active trigger sessions
-        self.active_triggers: Dict[int, Dict[str, Any]] = {}
+        # Private generator for recognition draws, independent of the
+        # module-level random state
+        self._rng = random.Random()
+
+        # Typed configuration values and the getConfig answer, refreshed
+        # whenever the configuration changes
+        self._cached_config_answer: Optional[ConfigAnswer] = None
+        self._refresh_config_values()
+        self.config_manager.register_listener(self._refresh_config_values)
+
+        # Static answers, built once and shared by every request
+        self._xsd_answer = XSDAnswer(xsd=_XSD_BASE64)
+        self._traces_answer = TracesAnswer(
+            traces={
+                "currentExecution_old": "BASE64_TRACES_OLD",
+                "currentExecution_current": "BASE64_TRACES_NEW",
+            }
+        )
+        # getInfos answers keyed by the device lock state
+        self._infos_answers: Dict[bool, InfosAnswer] = {
+            locked: self._build_infos_answer(locked) for locked in (False, True)
+        }
+        # Serialized forms of the static answers, keyed by object identity.
+        # HTTP answers use the wire aliases, WebSocket answers the field names.
+        static_answers = (
+            _SUCCESS_ANSWER,
+            self._xsd_answer,
+            self._traces_answer,
+            *self._infos_answers.values(),
+        )
+        self._static_http_json: Dict[int, bytes] = {
+            id(answer): pydantic_core.to_json(answer, by_alias=True)
+            for answer in static_answers
+        }
+        self._static_ws_json: Dict[int, str] = {
+            id(answer): answer.model_dump_json() for answer in static_answers
+        }
 
-        # Sample image data (base64 encoded)
-        self.sample_image = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg=="
+        # getDatabase answer and the plate set it was built from
+        self._cached_database_answer: Optional[Tuple[FrozenSet[str], DatabaseAnswer]] = None
+
+        # Active trigger sessions
+        self.active_triggers: Dict[int, TriggerSession] = {}
+        # Camera ID -> its active trigger IDs, oldest first
+        self._triggers_by_camera: Dict[str, Deque[int]] = {}
+        # Trigger ID source; next() on it is atomic, so HTTP and WebSocket
+        # threads never get the same ID
+        self._trigger_ids: Iterator[int] = itertools.count(1)
 
     def process_message(self, message: MessageType) -> Tuple[Union[AnswerType, None], int]:
         """
@@ -116,73 +259,79 @@ class DeviceLogic:
         Returns:
             Tuple of (response message, HTTP status code)
         """
-        self.logger.info(f"Received message of type: {type(message).__name__}")
-        match message:
-            case GetConfigMessage():
-                return self._handle_get_config(message), 200
-            case GetCurrentLogMessage():
-                return self._handle_get_current_log(message), 200
-            case GetDataBaseModel():
-                return self._handle_get_database(message), 200
-            case GetDateMessage():
-                return self._handle_get_date(message), 200
-            case GetImageMessage():
-                return self._handle_get_image(message), 200
-            case GetInfosMessage():
-                return self._handle_get_infos(message), 200
-            case GetLogMessage():
-                return self._handle_get_log(message), 200
-            case GetTracesMessage():
-                return self._handle_get_traces(message), 200
-            case GetXSDMessage():
-                return self._handle_get_xsd(message), 200
-            case OpenBarrierMessage():
-                return self._handle_open_barrier(message), 200
-            case TriggerOnMessage():
-                return self._handle_trigger_on(message), 200
-            case TriggerOffMessage():
-                return self._handle_trigger_off(message), 200
-            case LockMessage():
-                return self._handle_lock(message), 200
-            case UnlockMessage():
-                return self._handle_unlock(message), 200
-            case ResetConfigMessage():
-                return self._handle_reset_config(message), 200
-            case ResetEngineMessage():
-                return self._handle_reset_engine(message), 200
-            case SetConfigMessage():
-                return self._handle_set_config(message), 200
-            case EditDatabaseMessage():
-                return self._handle_edit_database(message), 200
-            case ResetCountersMessage():
-                return self._handle_reset_counters(message), 200
-            case AllowSetConfigMessage():
-                return self._handle_allow_set_config(message), 200
-            case ForbidSetConfigMessage():
-                return self._handle_forbid_set_config(message), 200
-            case CalibrateZoomFocusMessage():
-                return self._handle_calibrate_zoom_focus(message), 200
-            case SetEnableStreamsRequest():
-                return self._handle_set_enable_streams(message.set_enable_streams), 200
-            case UpdateMessage():
-                return self._handle_update(message), 200
-            case SetupMessage():
-                return self._handle_setup(message), 200
-            case KeepAliveMessage():
-                return self._handle_keep_alive(message), 200
-            case SetSecurityMessage():
-                return self._handle_set_security(message), 200
-            case TestFTPMessage():
-                return self._handle_test_ftp(message), 200
-            case TestNTPMessage():
-                return self._handle_test_ntp(message), 200
-            case UpdateWebFirmwareMessage():
-                return self._handle_update_web_firmware(message), 200
-            case EraseDatabaseMessage():
-                return self._handle_erase_database(message), 200
-            case RebootMessage():
-                return self._handle_reboot(message), 200
-        raise NotImplementedError(f"Unknown message type: {type(message).__name__}")
+        return self._dispatch(message), 200
+
+    def _dispatch(self, message: MessageType) -> HandlerResult:
+        """
+        Run the handler registered for a message's type.
+
+        Args:
+            message: CDK message as a Pydantic model
+
+        Returns:
+            Response message or None
+        """
+        message_type = type(message)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Received message of type: %s", message_type.__name__)
+        handler = _HANDLERS.get(message_type)
+        if handler is None:
+            handler = self._resolve_handler(message_type)
+        return handler(self, message)
+
+    def _resolve_handler(self, message_type: type) -> MessageHandler:
+        """
+        Find the handler for a message type that has no direct table entry.
+
+        Walks the type's MRO so subclasses of a known message are handled
+        like their base class, and caches the result for the next lookup.
+
+        Args:
+            message_type: Type of the incoming message
+
+        Returns:
+            Handler for the message type
+        """
+        for base in message_type.__mro__[1:]:
+            handler = _HANDLERS.get(base)
+            if handler is not None:
+                _HANDLERS[message_type] = handler
+                return handler
+        raise NotImplementedError(f"Unknown message type: {message_type.__name__}")
+
+    def answer_to_http_json(self, answer: HandlerResult) -> bytes:
+        """
+        Serialize an answer for an HTTP response.
+
+        Static answers are served from a cache filled at start-up.
+
+        Args:
+            answer: Answer returned by process_message
+
+        Returns:
+            JSON bytes using the wire aliases
+        """
+        cached = self._static_http_json.get(id(answer))
+        if cached is not None:
+            return cached
+        return pydantic_core.to_json(answer, by_alias=True)
+
+    def answer_to_ws_json(self, answer: AnswerType) -> str:
+        """
+        Serialize an answer for a WebSocket frame.
+
+        Static answers are served from a cache filled at start-up.
+
+        Args:
+            answer: Answer returned by process_websocket_message
+
+        Returns:
+            JSON text
+        """
+        cached = self._static_ws_json.get(id(answer))
+        if cached is not None:
+            return cached
+        return answer.model_dump_json()
 
     def process_websocket_message(self, message: bytes) -> Optional[AnswerType]:
         """
@@ -194,18 +343,8 @@ class DeviceLogic:
         Returns:
             Response message or None
         """
-        self.logger.info("Received WebSocket message")
-        # Parse the message
-        parsed = parse_message(message)
-
-        # Handle the message based on type
-        if isinstance(parsed, SetEnableStreamsRequest):
-            return self._handle_set_enable_streams(parsed.set_enable_streams)
-        else:
-            resp, code = self.process_message(parsed)
-            if code != 200:
-                raise Exception(f"Error processing message: {resp}")
-            return resp
+        self.logger.debug("Received WebSocket message")
+        return self._dispatch(parse_message(message))
 
     def generate_recognition_event(self, plate: Optional[str] = None) -> AnprEvent:
         """
@@ -217,15 +356,33 @@ class DeviceLogic:
         Returns:
             Recognition event data
         """
-        self.logger.info(f"Generating recognition event. Provided plate: {plate}")
-        # Generate random plate if none provided
         if plate is None:
-            all_plates = ["XX 000 XX", "XX 000 XY"]
-            plate = random.choice(all_plates)
+            return self.generate_random_recognition()
+        return self._build_recognition(plate)
+
+    def generate_random_recognition(self) -> AnprEvent:
+        """
+        Generate a recognition event for a randomly picked sample plate.
 
+        Returns:
+            Recognition event data
+        """
+        return self._build_recognition(self._rng.choice(_SAMPLE_PLATES))
+
+    def _build_recognition(self, plate: str) -> AnprEvent:
+        """
+        Build a recognition event and store it as the current recognition.
+
+        Args:
+            plate: License plate
+
+        Returns:
+            Recognition event data
+        """
+        self.logger.debug("Generating recognition event for plate: %s", plate)
         # Get configuration values
-        reliability = int(self.config_manager.get_value("plateReliability", 80))
-        context = self.config_manager.get_value("defaultContext", "F")
+        reliability = self._plate_reliability
+        context = self._default_context
 
         # Create recognition data
         recognition = AnprEvent(
@@ -235,14 +392,14 @@ class DeviceLogic:
                     plate=plate,
                     reliability=reliability,
                     context=context,
-                    jpeg=self.sample_image,
-                    reliability_per_character=ReliabilityPerCharacter(
-                        char=[CharacterReliability(index=i, reliability=reliability) for i, _l in enumerate(plate)]
+                    jpeg=_SAMPLE_IMAGE,
+                    reliability_per_character=_reliability_per_character(
+                        len(plate), reliability
                     ),
                     database=DatabaseMatch(
                         plate=plate,
                         distance=0,
-                    ) if plate in self.data_store.get_database_plates() else None
+                    ) if self.data_store.is_plate_in_database(plate) else None
                 ),
             )
         )
@@ -258,11 +415,28 @@ class DeviceLogic:
         Returns:
             True if plate should be recognized, False otherwise
         """
-        self.logger.info(
+        self.logger.debug(
             "Evaluating if a plate should be recognized based on configured success rate"
         )
-        success_rate = self.config_manager.get_value("recognitionSuccessRate", 75)
-        return random.randint(1, 100) <= success_rate
+        rate = self._recognition_success_rate
+        if rate >= 100:
+            return True
+        if rate <= 0:
+            return False
+        return self._rng.random() * 100 < rate
+
+    def _refresh_config_values(self) -> None:
+        """
+        Reload the configuration values used on the request path.
+
+        Registered as a ConfigManager listener so the typed copies and the
+        cached getConfig answer never outlive a configuration change.
+        """
+        config = self.config_manager.get_config()
+        self._plate_reliability = int(config.get("plateReliability", 80))
+        self._default_context: str = config.get("defaultContext", "F")
+        self._recognition_success_rate = int(config.get("recognitionSuccessRate", 75))
+        self._cached_config_answer = None
 
     def _create_success_response(self) -> StatusAnswer:
         """
@@ -271,8 +445,8 @@ class DeviceLogic:
         Returns:
             Success response
         """
-        self.logger.info("Creating a success response")
-        return SuccessResponse().as_answer()
+        self.logger.debug("Creating a success response")
+        return _SUCCESS_ANSWER
 
     def _create_error_response(self, error_text: str) -> StatusAnswer:
         """
@@ -284,8 +458,8 @@ class DeviceLogic:
         Returns:
             Error response
         """
-        self.logger.warning(f"Creating an error response with message: {error_text}")
-        return ErrorResponse.for_error_text(error_text).as_answer()
+        self.logger.warning("Creating an error response with message: %s", error_text)
+        return _error_answer(error_text)
 
     def _handle_get_config(self, message: GetConfigMessage) -> AnswerType:
         """
@@ -297,11 +471,14 @@ class DeviceLogic:
         Returns:
             Config response
         """
-        self.logger.info(
+        self.logger.debug(
             "Handling GetConfigMessage to retrieve current device configuration"
         )
-        reliability = self.config_manager.get_value("plateReliability", 80)
-        context = self.config_manager.get_value("defaultContext", "F")
+        if self._cached_config_answer is not None:
+            return self._cached_config_answer
+
+        reliability = self._plate_reliability
+        context = self._default_context
 
         config = {
             "device": {"@name": "Simulator Device", "@installationHeight_cm": "100"},
@@ -329,27 +506,8 @@ class DeviceLogic:
             "database": {"@enabled": "0", "@openForAll": "0"},
             "io": {"defaultImpulse": {"@pulseMode": "rising", "@duration_ms": "500"}},
         }
-        return ConfigAnswer(config=config)
-
-    def _handle_get_current_log(self, message: GetCurrentLogMessage) -> AnswerType:
-        """
-        Handle getCurrentLog message.
-
-        Args:
-            message: GetCurrentLogMessage model
-
-        Returns:
-            Current log response
-        """
-        self.logger.info("Handling GetCurrentLogMessage to retrieve the current log")
-        recognition = self.data_store.get_current_recognition()
-        if recognition is None:
-            if self.should_recognize_plate():
-                recognition = self.generate_recognition_event()
-            else:
-                return self._create_error_response("No current recognition")
-
-        return LogAnswer(anpr=recognition.anpr)
+        self._cached_config_answer = ConfigAnswer(config=config)
+        return self._cached_config_answer
 
     def _handle_get_database(self, message: GetDataBaseModel) -> AnswerType:
         """
@@ -361,13 +519,18 @@ class DeviceLogic:
         Returns:
             Database response
         """
-        self.logger.info("Handling GetDataBaseModel to retrieve database information")
-        plates = self.data_store.get_database_plates()
+        self.logger.debug("Handling GetDataBaseModel to retrieve database information")
+        plates = self.data_store.get_database_snapshot()
+        cached = self._cached_database_answer
+        if cached is not None and cached[0] is plates:
+            return cached[1]
 
-        return DatabaseAnswer(database=[
+        answer = DatabaseAnswer(database=[
             PlateReading(value=plate)
             for plate in plates
         ])
+        self._cached_database_answer = (plates, answer)
+        return answer
 
     def _handle_get_date(self, message: GetDateMessage) -> AnswerType:
         """
@@ -379,10 +542,10 @@ class DeviceLogic:
         Returns:
             Date response
         """
-        self.logger.info(
+        self.logger.debug(
             "Handling GetDateMessage to retrieve the current simulated date"
         )
-        date = {"@date": str(self.data_store.get_simulated_date())}
+        date = {"@date": self.data_store.get_simulated_date_str()}
         return DateAnswer(date=date)
 
     def _handle_get_image(self, message: GetImageMessage) -> AnswerType:
@@ -395,10 +558,10 @@ class DeviceLogic:
         Returns:
             Image response
         """
-        self.logger.info("Handling GetImageMessage to retrieve the current image data")
+        self.logger.debug("Handling GetImageMessage to retrieve the current image data")
         image = {
-            "@date": str(self.data_store.get_simulated_date()),
-            "jpeg": self.sample_image,
+            "@date": self.data_store.get_simulated_date_str(),
+            "jpeg": _SAMPLE_IMAGE,
         }
         return ImageAnswer(image=image)
 
@@ -412,7 +575,20 @@ class DeviceLogic:
         Returns:
             Infos response
         """
-        self.logger.info("Handling GetInfosMessage to retrieve device information")
+        self.logger.debug("Handling GetInfosMessage to retrieve device information")
+        return self._infos_answers[self.data_store.is_device_locked()]
+
+    @staticmethod
+    def _build_infos_answer(locked: bool) -> InfosAnswer:
+        """
+        Build the getInfos answer for a given lock state.
+
+        Args:
+            locked: Whether the device reports itself as locked
+
+        Returns:
+            Infos response
+        """
         infos = DeviceInfoResponse(
             sensor=DeviceInfo(
                 type="Simulator",
@@ -420,7 +596,7 @@ class DeviceLogic:
                 serial="SIM12345",
                 mac_address="00:11:22:33:44:55",
                 status="RUNNING",
-                locked=self.data_store.is_device_locked(),
+                locked=locked,
             ),
             cameras={
                 "camera": CameraInfo(
@@ -437,21 +613,23 @@ class DeviceLogic:
         )
         return InfosAnswer(infos=infos)
 
-    def _handle_get_log(self, message: GetLogMessage) -> AnswerType:
+    def _handle_get_log(
+        self, message: Union[GetLogMessage, GetCurrentLogMessage]
+    ) -> AnswerType:
         """
-        Handle getLog message.
+        Handle getLog and getCurrentLog messages, which share one answer.
 
         Args:
-            message: GetLogMessage model
+            message: GetLogMessage or GetCurrentLogMessage model
 
         Returns:
             Log response
         """
-        self.logger.info("Handling GetLogMessage to retrieve log data")
+        self.logger.debug("Handling %s to retrieve the current log", type(message).__name__)
         recognition = self.data_store.get_current_recognition()
         if recognition is None:
             if self.should_recognize_plate():
-                recognition = self.generate_recognition_event()
+                recognition = self.generate_random_recognition()
             else:
                 return self._create_error_response("No current recognition")
 
@@ -467,12 +645,8 @@ class DeviceLogic:
         Returns:
             Traces response
         """
-        self.logger.info("Handling GetTracesMessage to retrieve trace data")
-        traces = {
-            "currentExecution_old": "BASE64_TRACES_OLD",
-            "currentExecution_current": "BASE64_TRACES_NEW",
-        }
-        return TracesAnswer(traces=traces)
+        self.logger.debug("Handling GetTracesMessage to retrieve trace data")
+        return self._traces_answer
 
     def _handle_get_xsd(self, message: GetXSDMessage) -> AnswerType:
         """
@@ -484,11 +658,8 @@ class DeviceLogic:
         Returns:
             XSD response
         """
-        self.logger.info("Handling GetXSDMessage to retrieve XSD schema")
-        xsd_content = '<?xml version="1.0" encoding="UTF-8"?><xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"></xs:schema>'
-        xsd_base64 = base64.b64encode(xsd_content.encode()).decode()
-
-        return XSDAnswer(xsd=xsd_base64)
+        self.logger.debug("Handling GetXSDMessage to retrieve XSD schema")
+        return self._xsd_answer
 
     def _handle_open_barrier(self, message: OpenBarrierMessage) -> StatusAnswer:
         """
@@ -500,7 +671,7 @@ class DeviceLogic:
         Returns:
             Success response
         """
-        self.logger.info("Handling OpenBarrierMessage to open the barrier")
+        self.logger.debug("Handling OpenBarrierMessage to open the barrier")
         self.data_store.open_barrier()
         return self._create_success_response()
 
@@ -514,21 +685,16 @@ class DeviceLogic:
         Returns:
             Trigger response
         """
-        self.logger.info("Handling TriggerOnMessage to activate a trigger")
-        # Extract parameters
-        message_data = message.trigger_on
-        camera_id = message_data.get("@cameraId", "0") if message_data else "0"
-        timeout = int(message_data.get("@timeout", "1000")) if message_data else 1000
+        self.logger.debug("Handling TriggerOnMessage to activate a trigger")
+        camera_id = message.trigger_on.camera_id
+        timeout = message.trigger_on.timeout
 
-        # Generate trigger ID
-        trigger_id = random.randint(1, 10000)
+        # Allocate a unique trigger ID
+        trigger_id = next(self._trigger_ids)
 
         # Store trigger session
-        self.active_triggers[trigger_id] = {
-            "cameraId": camera_id,
-            "timeout": timeout,
-            "startTime": time.time(),
-        }
+        self.active_triggers[trigger_id] = TriggerSession(camera_id, timeout, time.monotonic_ns())
+        self._triggers_by_camera.setdefault(camera_id, deque()).append(trigger_id)
 
         return TriggerAnswerData.ok_for_id(trigger_id).as_answer()
 
@@ -542,16 +708,17 @@ class DeviceLogic:
         Returns:
             Trigger response
         """
-        self.logger.info("Handling TriggerOffMessage to deactivate a trigger")
-        # Extract parameters
-        message_data = message.trigger_off
-        camera_id = message_data.get("@cameraId", "0") if message_data else "0"
+        self.logger.debug("Handling TriggerOffMessage to deactivate a trigger")
+        camera_id = message.trigger_off.camera_id
 
-        # Find and remove trigger session
-        for trigger_id, trigger in list(self.active_triggers.items()):
-            if trigger["cameraId"] == camera_id:
-                del self.active_triggers[trigger_id]
-                return TriggerAnswerData.ok_for_id(trigger_id).as_answer()
+        # Remove the oldest trigger session of that camera
+        camera_triggers = self._triggers_by_camera.get(camera_id)
+        if camera_triggers:
+            trigger_id = camera_triggers.popleft()
+            if not camera_triggers:
+                del self._triggers_by_camera[camera_id]
+            del self.active_triggers[trigger_id]
+            return TriggerAnswerData.ok_for_id(trigger_id).as_answer()
 
         return TriggerAnswerData.failed_for_id(0).as_answer()
 
@@ -565,7 +732,7 @@ class DeviceLogic:
         Returns:
             Success response
         """
-        self.logger.info("Handling LockMessage to lock the device")
+        self.logger.debug("Handling LockMessage to lock the device")
         password = message.lock.password
         if self.data_store.lock_device(password):
             return self._create_success_response()
@@ -581,7 +748,7 @@ class DeviceLogic:
         Returns:
             Success response
         """
-        self.logger.info("Handling UnlockMessage to unlock the device")
+        self.logger.debug("Handling UnlockMessage to unlock the device")
         if self.data_store.unlock_device():
             return self._create_success_response()
         return self._create_error_response("Failed to unlock device")
@@ -596,7 +763,7 @@ class DeviceLogic:
         Returns:
             Success response
         """
-        self.logger.info(
+        self.logger.debug(
             "Handling ResetConfigMessage to reset device configuration to default"
         )
         self.config_manager.update_config(ConfigManager.DEFAULT_CONFIG)
@@ -612,7 +779,7 @@ class DeviceLogic:
         Returns:
             Success response
         """
-        self.logger.info("Handling ResetEngineMessage to reset the engine state")
+        self.logger.debug("Handling ResetEngineMessage to reset the engine state")
         empty_recognition = AnprEvent(
             anpr=RecognitionEvent(
                 date=datetime.fromtimestamp(0),
@@ -634,7 +801,7 @@ class DeviceLogic:
         Returns:
             Success response
         """
-        self.logger.info("Handling SetConfigMessage to update device configuration")
+        self.logger.debug("Handling SetConfigMessage to update device configuration")
         if not self.data_store.is_config_allowed():
             return self._create_error_response("Configuration changes are not allowed")
 
@@ -643,19 +810,17 @@ class DeviceLogic:
             return self._create_error_response("Invalid config data")
 
         try:
-            config = message_data.get("config", {})
-            cameras = config.get("cameras", {})
-            camera = cameras.get("camera", {})
-            anpr = camera.get("anpr", {})
-            plate_reliability = anpr.get("@plateReliability")
-
-            if plate_reliability is not None:
-                self.config_manager.set_value(
-                    "plateReliability", int(plate_reliability)
-                )
-        except (KeyError, ValueError, TypeError) as e:
+            value = message_data["config"]["cameras"]["camera"]["anpr"]["@plateReliability"]
+            # An explicit null leaves the setting unchanged
+            plate_reliability = int(value) if value is not None else None
+        except KeyError:
+            # No setting this simulator models was sent
+            return self._create_success_response()
+        except (ValueError, TypeError) as e:
             return self._create_error_response(f"Invalid config format: {str(e)}")
 
+        if plate_reliability is not None:
+            self.config_manager.set_value("plateReliability", plate_reliability)
         return self._create_success_response()
 
     def _handle_edit_database(self, message: EditDatabaseMessage) -> AnswerType:
@@ -668,45 +833,30 @@ class DeviceLogic:
         Returns:
             Success response
         """
-        self.logger.info("Handling EditDatabaseMessage to modify the database")
+        self.logger.debug("Handling EditDatabaseMessage to modify the database")
         message_data = message.edit_database
 
-        add_plate = getattr(message_data, "add_plate", None)
-        if add_plate is not None:
+        if isinstance(message_data, AddPlateModel):
             try:
-                plate = add_plate.value
+                plate = message_data.add_plate.value
                 self.data_store.add_plate_to_database(plate)
                 return self._create_success_response()
-            except Exception as e:
+            except (ValueError, TypeError) as e:
                 return self._create_error_response(f"Invalid add plate data: {str(e)}")
 
-        del_plate = getattr(message_data, "del_plate", None)
-        if del_plate is not None:
+        if isinstance(message_data, DelPlateModel):
             try:
-                plate = del_plate.value
+                plate = message_data.del_plate.value
                 if self.data_store.remove_plate_from_database(plate):
                     return self._create_success_response()
                 return self._create_error_response(f"Plate not found: {plate}")
-            except Exception as e:
+            except (ValueError, TypeError) as e:
                 return self._create_error_response(
                     f"Invalid delete plate data: {str(e)}"
                 )
 
         return self._create_error_response("Invalid database edit operation")
 
-    def _handle_reset_counters(self, message: ResetCountersMessage) -> AnswerType:
-        """
-        Handle resetCounters message.
-
-        Args:
-            message: ResetCountersMessage model
-
-        Returns:
-            Success response
-        """
-        self.logger.info("Handling ResetCountersMessage to reset counters")
-        return self._create_success_response()
-
     def _handle_allow_set_config(self, message: AllowSetConfigMessage) -> AnswerType:
         """
         Handle allowSetConfig message.
@@ -717,7 +867,7 @@ class DeviceLogic:
         Returns:
             Success response
         """
-        self.logger.info(
+        self.logger.debug(
             "Handling AllowSetConfigMessage to allow configuration changes"
         )
         self.data_store.set_allow_config(True)
@@ -733,56 +883,24 @@ class DeviceLogic:
         Returns:
             Success response
         """
-        self.logger.info(
+        self.logger.debug(
             "Handling ForbidSetConfigMessage to forbid configuration changes"
         )
         self.data_store.set_allow_config(False)
         return self._create_success_response()
 
-    def _handle_calibrate_zoom_focus(
-        self, message: CalibrateZoomFocusMessage
-    ) -> AnswerType:
-        """
-        Handle calibrateZoomFocus message.
-
-        Args:
-            message: CalibrateZoomFocusMessage model
-
-        Returns:
-            Success response
-        """
-        self.logger.info(
-            "Handling CalibrateZoomFocusMessage to calibrate zoom and focus"
-        )
-        return self._create_success_response()
-
-    def _handle_set_enable_streams(self, stream_config: StreamConfig) -> None:
+    def _handle_set_enable_streams(self, message: SetEnableStreamsRequest) -> None:
         """
         Handle setEnableStreams message.
 
         Args:
-            stream_config: StreamConfig model
-
-        Returns:
-            Stream response
+            message: SetEnableStreamsRequest model
         """
-        self.logger.info(
+        self.logger.debug(
             "Handling SetEnableStreamsRequest to configure stream settings"
         )
-        self.data_store.set_stream_config(stream_config)
-
+        self.data_store.set_stream_config(message.set_enable_streams)
 
-    def _handle_update(self, message: UpdateMessage) -> AnswerType:
-        self.logger.info("Handling UpdateMessage to update device state")
-        return self._create_success_response()
-
-    def _handle_setup(self, message: SetupMessage) -> AnswerType:
-        self.logger.info("Handling SetupMessage to perform setup operations")
-        return self._create_success_response()
-
-    def _handle_keep_alive(self, message: KeepAliveMessage) -> AnswerType:
-        self.logger.info("Handling KeepAliveMessage to maintain connection")
-        return self._create_success_response()
 
     def _handle_set_security(self, message: SetSecurityMessage) -> AnswerType:
         """
@@ -794,7 +912,7 @@ class DeviceLogic:
         Returns:
             Success response or error response
         """
-        self.logger.info("Handling SetSecurityMessage to update security settings")
+        self.logger.debug("Handling SetSecurityMessage to update security settings")
         
         if not self.data_store.is_device_locked():
             return self._create_error_response("Device must be locked to change security settings")
@@ -831,7 +949,7 @@ class DeviceLogic:
         Returns:
             Success response or error response
         """
-        self.logger.info("Handling TestFTPMessage to test FTP server connectivity")
+        self.logger.debug("Handling TestFTPMessage to test FTP server connectivity")
         
         # Extract FTP server details
         ftp_config = message.test_ftp
@@ -841,7 +959,7 @@ class DeviceLogic:
         
         # In a real implementation, we would test the connection
         # For simulation, we'll just return success
-        self.logger.info(f"Simulating FTP test to server: {ftp_config.address}")
+        self.logger.info("Simulating FTP test to server: %s", ftp_config.address)
         
         return self._create_success_response()
 
@@ -855,7 +973,7 @@ class DeviceLogic:
         Returns:
             Success response or error response
         """
-        self.logger.info("Handling TestNTPMessage to test NTP server connectivity")
+        self.logger.debug("Handling TestNTPMessage to test NTP server connectivity")
         
         # Extract NTP server details
         ntp_config = message.test_ntp
@@ -865,7 +983,7 @@ class DeviceLogic:
         
         # In a real implementation, we would test the connection
         # For simulation, we'll just return success
-        self.logger.info(f"Simulating NTP test to server: {ntp_config.host}")
+        self.logger.info("Simulating NTP test to server: %s", ntp_config.host)
         
         return self._create_success_response()
 
@@ -879,7 +997,7 @@ class DeviceLogic:
         Returns:
             Success response or error response
         """
-        self.logger.info("Handling UpdateWebFirmwareMessage to update firmware from web")
+        self.logger.debug("Handling UpdateWebFirmwareMessage to update firmware from web")
         
         # Extract firmware URL
         firmware_config = message.update_web_firmware
@@ -889,7 +1007,7 @@ class DeviceLogic:
         
         # In a real implementation, we would download and install the firmware
         # For simulation, we'll just return success
-        self.logger.info(f"Simulating firmware update from URL: {firmware_config.url}")
+        self.logger.info("Simulating firmware update from URL: %s", firmware_config.url)
         
         return self._create_success_response()
 
@@ -903,7 +1021,7 @@ class DeviceLogic:
         Returns:
             Success response or error response
         """
-        self.logger.info("Handling EraseDatabaseMessage to erase the internal database")
+        self.logger.debug("Handling EraseDatabaseMessage to erase the internal database")
         
         if not self.data_store.is_device_locked():
             return self._create_error_response("Device must be locked to erase database")
@@ -924,7 +1042,7 @@ class DeviceLogic:
         Returns:
             Success response or error response
         """
-        self.logger.info("Handling RebootMessage to reboot the device")
+        self.logger.debug("Handling RebootMessage to reboot the device")
         
         if not self.data_store.is_device_locked():
             return self._create_error_response("Device must be locked to reboot")
@@ -934,3 +1052,41 @@ class DeviceLogic:
         self.data_store.simulate_reboot()
         
         return self._create_success_response()
+
+
+# Message type -> handler function, shared by all instances so dispatch is a
+# single dict lookup. Handlers are called as handler(device_logic, message).
+_HANDLERS: Dict[type, MessageHandler] = {
+    GetConfigMessage: DeviceLogic._handle_get_config,
+    GetCurrentLogMessage: DeviceLogic._handle_get_log,
+    GetDataBaseModel: DeviceLogic._handle_get_database,
+    GetDateMessage: DeviceLogic._handle_get_date,
+    GetImageMessage: DeviceLogic._handle_get_image,
+    GetInfosMessage: DeviceLogic._handle_get_infos,
+    GetLogMessage: DeviceLogic._handle_get_log,
+    GetTracesMessage: DeviceLogic._handle_get_traces,
+    GetXSDMessage: DeviceLogic._handle_get_xsd,
+    OpenBarrierMessage: DeviceLogic._handle_open_barrier,
+    TriggerOnMessage: DeviceLogic._handle_trigger_on,
+    TriggerOffMessage: DeviceLogic._handle_trigger_off,
+    LockMessage: DeviceLogic._handle_lock,
+    UnlockMessage: DeviceLogic._handle_unlock,
+    ResetConfigMessage: DeviceLogic._handle_reset_config,
+    ResetEngineMessage: DeviceLogic._handle_reset_engine,
+    SetConfigMessage: DeviceLogic._handle_set_config,
+    EditDatabaseMessage: DeviceLogic._handle_edit_database,
+    ResetCountersMessage: _acknowledge,
+    AllowSetConfigMessage: DeviceLogic._handle_allow_set_config,
+    ForbidSetConfigMessage: DeviceLogic._handle_forbid_set_config,
+    CalibrateZoomFocusMessage: _acknowledge,
+    SetEnableStreamsRequest: DeviceLogic._handle_set_enable_streams,
+    UpdateMessage: _acknowledge,
+    SetupMessage: _acknowledge,
+    KeepAliveMessage: _acknowledge,
+    SetSecurityMessage: DeviceLogic._handle_set_security,
+    TestFTPMessage: DeviceLogic._handle_test_ftp,
+    TestNTPMessage: DeviceLogic._handle_test_ntp,
+    UpdateWebFirmwareMessage: DeviceLogic._handle_update_web_firmware,
+    EraseDatabaseMessage: DeviceLogic._handle_erase_database,
+    RebootMessage: DeviceLogic._handle_reboot,
+}
@@ -102,6 +102,8 @@ def signal_handler(sig: int, frame: Any) -> None:
 
 def main() -> None:
     """Main entry point."""
+    logging.basicConfig(level=logging.DEBUG)
+
     # Register signal handler
     signal.signal(signal.SIGINT, signal_handler)
     
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Dict, List, Literal, Optional, Any, Type, TypeVar, Union
+from typing import Annotated, Dict, List, Literal, Optional, Any, Type, TypeVar, Union
 
 from pydantic import (
     BaseModel,
@@ -8,6 +8,8 @@ from pydantic import (
     model_validator,
     TypeAdapter,
     ConfigDict,
+    Discriminator,
+    Tag,
 )
 
 T = TypeVar("T", bound=BaseModel)
@@ -290,10 +292,27 @@ class OpenBarrierMessage(BaseModel):
     open_barrier: None = Field(default=None, alias="openBarrier")
 
 
+class TriggerOnData(BaseModel):
+    """Model for triggerOn parameters."""
+
+    model_config = ConfigDict(populate_by_name=True, coerce_numbers_to_str=True)
+
+    camera_id: str = Field(default="0", alias="@cameraId")
+    timeout: int = Field(default=1000, alias="@timeout")
+
+
+class TriggerOffData(BaseModel):
+    """Model for triggerOff parameters."""
+
+    model_config = ConfigDict(populate_by_name=True, coerce_numbers_to_str=True)
+
+    camera_id: str = Field(default="0", alias="@cameraId")
+
+
 class TriggerOnMessage(BaseModel):
     """Model for triggerOn message."""
 
-    trigger_on: Dict[str, Any] = Field(alias="triggerOn")
+    trigger_on: TriggerOnData = Field(alias="triggerOn")
 
     @model_validator(mode="before")
     @classmethod
@@ -309,7 +328,7 @@ class TriggerOnMessage(BaseModel):
 class TriggerOffMessage(BaseModel):
     """Model for triggerOff message."""
 
-    trigger_off: Dict[str, Any] = Field(alias="triggerOff")
+    trigger_off: TriggerOffData = Field(alias="triggerOff")
 
     @model_validator(mode="before")
     @classmethod
@@ -714,39 +733,67 @@ AnswerType = Union[
     StreamAnswer,
 ]
 
-MessageType = Union[
-    GetConfigMessage,
-    GetCurrentLogMessage,
-    GetDataBaseModel,
-    GetDateMessage,
-    GetImageMessage,
-    GetInfosMessage,
-    GetLogMessage,
-    GetTracesMessage,
-    GetXSDMessage,
-    OpenBarrierMessage,
-    TriggerOnMessage,
-    TriggerOffMessage,
-    LockMessage,
-    UnlockMessage,
-    ResetConfigMessage,
-    ResetEngineMessage,
-    SetConfigMessage,
-    EditDatabaseMessage,
-    ResetCountersMessage,
-    AllowSetConfigMessage,
-    ForbidSetConfigMessage,
-    CalibrateZoomFocusMessage,
-    SetEnableStreamsRequest,
-    KeepAliveMessage,
-    UpdateMessage,
-    SetupMessage,
-    SetSecurityMessage,
-    TestFTPMessage,
-    TestNTPMessage,
-    UpdateWebFirmwareMessage,
-    EraseDatabaseMessage,
-    RebootMessage,
+
+def _message_key(value: Any) -> Optional[str]:
+    """
+    Return the top-level key that identifies a message.
+
+    Args:
+        value: Raw message data or an already built message model
+
+    Returns:
+        The message key, or None if there is none
+    """
+    if isinstance(value, dict):
+        return next(iter(value), None)
+    if isinstance(value, BaseModel):
+        name, field = next(iter(type(value).model_fields.items()))
+        return field.alias or name
+    return None
+
+
+# Messages are tagged by their single top-level key, so validation only
+# tries the model that key names instead of every member of the union
+MessageType = Annotated[
+    Union[
+        Annotated[GetConfigMessage, Tag("getConfig")],
+        Annotated[GetCurrentLogMessage, Tag("getCurrentLog")],
+        Annotated[GetDataBaseModel, Tag("getDatabase")],
+        Annotated[GetDateMessage, Tag("getDate")],
+        Annotated[GetImageMessage, Tag("getImage")],
+        Annotated[GetInfosMessage, Tag("getInfos")],
+        Annotated[GetLogMessage, Tag("getLog")],
+        Annotated[GetTracesMessage, Tag("getTraces")],
+        Annotated[GetXSDMessage, Tag("getXSD")],
+        Annotated[OpenBarrierMessage, Tag("openBarrier")],
+        Annotated[TriggerOnMessage, Tag("triggerOn")],
+        Annotated[TriggerOffMessage, Tag("triggerOff")],
+        Annotated[LockMessage, Tag("lock")],
+        Annotated[UnlockMessage, Tag("unlock")],
+        Annotated[ResetConfigMessage, Tag("resetConfig")],
+        Annotated[ResetEngineMessage, Tag("resetEngine")],
+        Annotated[SetConfigMessage, Tag("setConfig")],
+        Annotated[EditDatabaseMessage, Tag("editDatabase")],
+        Annotated[ResetCountersMessage, Tag("resetCounters")],
+        Annotated[AllowSetConfigMessage, Tag("allowSetConfig")],
+        Annotated[ForbidSetConfigMessage, Tag("forbidSetConfig")],
+        Annotated[CalibrateZoomFocusMessage, Tag("calibrateZoomFocus")],
+        Annotated[SetEnableStreamsRequest, Tag("setEnableStreams")],
+        Annotated[KeepAliveMessage, Tag("keepAlive")],
+        Annotated[UpdateMessage, Tag("update")],
+        Annotated[SetupMessage, Tag("setup")],
+        Annotated[SetSecurityMessage, Tag("setSecurity")],
+        Annotated[TestFTPMessage, Tag("testFTP")],
+        Annotated[TestNTPMessage, Tag("testNTP")],
+        Annotated[UpdateWebFirmwareMessage, Tag("updateWebFirmware")],
+        Annotated[EraseDatabaseMessage, Tag("eraseDatabase")],
+        Annotated[RebootMessage, Tag("reboot")],
+    ],
+    Discriminator(
+        _message_key,
+        custom_error_type="unknown_message",
+        custom_error_message="Unknown message type",
+    ),
 ]
 MessageTypeModel: TypeAdapter[MessageType] = TypeAdapter(MessageType)
 
@@ -4,7 +4,7 @@ import logging
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from typing import Optional
 
-import pydantic_core
+from pydantic import ValidationError
 
 from survision_simulator.device_logic import DeviceLogic
 from survision_simulator.models import parse_message, requires_locking, is_prohibited_over_http
@@ -68,6 +68,11 @@ class SurvisionHTTPHandler(BaseHTTPRequestHandler):
         except json.JSONDecodeError:
             self.send_error(400, "Invalid JSON format")
             return
+        except ValidationError as e:
+            # The status line must stay on one line: send the first error as
+            # the reason and the full, multi-line report in the body
+            self.send_error(400, e.errors()[0]["msg"], str(e))
+            return
         except ValueError as e:
             self.send_error(400, str(e))
             return
@@ -100,7 +105,7 @@ class SurvisionHTTPHandler(BaseHTTPRequestHandler):
             self.send_header("Content-Type", "application/json")
             self.end_headers()
             
-            response_json_bytes = pydantic_core.to_json(response, by_alias=True)
+            response_json_bytes = self.device_logic.answer_to_http_json(response)
             self.wfile.write(response_json_bytes)
         finally:
             # Implicit unlock if we locked the device
@@ -120,12 +125,13 @@ class SurvisionHTTPHandler(BaseHTTPRequestHandler):
         if not self.device_logic:
             return False
         
-        # Check if device is already locked
-        if self.device_logic.data_store.is_device_locked():
-            return False
-        
-        # Lock the device
-        return self.device_logic.data_store.lock_device(password)
+        with self.device_logic.data_store.transaction() as state:
+            # Check if device is already locked
+            if state.is_device_locked():
+                return False
+            
+            # Lock the device
+            return state.lock_device(password)
     
     def _implicit_unlock(self) -> None:
         """Implicitly unlock the device."""
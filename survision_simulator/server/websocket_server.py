@@ -101,7 +101,7 @@ class SurvisionWebSocketServer:
                             
                             # Send response if needed
                             if response:
-                                await websocket.send(response.model_dump_json())
+                                await websocket.send(self.device_logic.answer_to_ws_json(response))
                         except Exception as e:
                             # Other errors
                             err_type = type(e).__name__